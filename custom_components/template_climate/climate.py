@@ -1,11 +1,11 @@
 """Support for Template climates."""
 
-import json
 import logging
-from collections.abc import Callable
+import operator
+from collections.abc import Callable, Coroutine, Sequence
 from enum import StrEnum
 from functools import partial
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, ClassVar
 
 import homeassistant.helpers.config_validation as cv
 import voluptuous as vol
@@ -25,7 +25,6 @@ from homeassistant.components.climate.const import (
     ATTR_SWING_MODE,
     ATTR_TARGET_TEMP_HIGH,
     ATTR_TARGET_TEMP_LOW,
-    CURRENT_HVAC_ACTIONS,
     DEFAULT_MAX_HUMIDITY,
     DEFAULT_MIN_HUMIDITY,
     FAN_OFF,
@@ -63,13 +62,15 @@ from homeassistant.const import (
     Platform,
     UnitOfTemperature,
 )
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import HomeAssistant, State, callback
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.reload import async_setup_reload_service
 from homeassistant.helpers.restore_state import RestoreEntity
-from homeassistant.helpers.script import Script
+from homeassistant.helpers.script import SCRIPT_MODE_QUEUED, SCRIPT_MODE_SINGLE, Script
 from homeassistant.helpers.template import Template
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
+from homeassistant.util.json import json_loads
 from homeassistant.util.unit_conversion import TemperatureConverter
 
 
@@ -87,10 +88,21 @@ class HVACFeature(StrEnum):
     SWING_HORIZONTAL_MODE = "swing_horizontal_mode"
 
 
-HVAC_FEATURES = [cls.value for cls in HVACFeature]
+HVAC_FEATURES = frozenset(cls.value for cls in HVACFeature)
+# Every HVACFeature is named after the ClimateEntityFeature flag it enables
+HVAC_FEATURE_FLAGS: dict[str, int] = {
+    feature.value: ClimateEntityFeature[feature.name].value for feature in HVACFeature
+}
+
+_INVALID_STATES = frozenset({STATE_UNAVAILABLE, STATE_UNKNOWN})
+_HVAC_ACTION_LOOKUP: dict[str, str] = {action.value: action for action in HVACAction}
+
+# Initial value for render caches, None is a valid template result
+_NOT_RENDERED: Any = object()
 
 _LOGGER = logging.getLogger(__name__)
 
+CONF_ACTION_NO_WAIT = "action_no_wait"
 CONF_CLIMATES = "climates"
 CONF_CURRENT_HUMIDITY_TEMPLATE = "current_humidity_template"
 CONF_CURRENT_TEMP_TEMPLATE = "current_temperature_template"
@@ -130,6 +142,23 @@ CONF_TURN_ON_ACTION = "turn_on"
 
 DOMAIN = "template_climate"
 DEFAULT_NAME = "Template Climate"
+DEFAULT_MODES = (HVACMode.AUTO, HVACMode.HEAT)
+DEFAULT_PRESET_MODES = ()
+DEFAULT_FAN_MODES = (FAN_OFF, FAN_ON)
+DEFAULT_SWING_MODES = (SWING_ON, SWING_OFF)
+DEFAULT_SWING_HORIZONTAL_MODES = (SWING_HORIZONTAL_ON, SWING_HORIZONTAL_OFF)
+
+ACTION_KEYS = (
+    CONF_TURN_ON_ACTION,
+    CONF_TURN_OFF_ACTION,
+    CONF_SET_TEMPERATURE_ACTION,
+    CONF_SET_HUMIDITY_ACTION,
+    CONF_SET_HVAC_MODE_ACTION,
+    CONF_SET_PRESET_MODE_ACTION,
+    CONF_SET_FAN_MODE_ACTION,
+    CONF_SET_SWING_MODE_ACTION,
+    CONF_SET_SWING_HORIZONTAL_MODE_ACTION,
+)
 
 
 CLIMATE_SCHEMA = {
@@ -158,7 +187,6 @@ CLIMATE_SCHEMA = {
     vol.Optional(CONF_FAN_MODE_TEMPLATE): cv.template,
     vol.Optional(CONF_SWING_MODE_TEMPLATE): cv.template,
     vol.Optional(CONF_SWING_HORIZONTAL_MODE_TEMPLATE): cv.template,
-    vol.Optional(CONF_HVAC_FEATURES_TEMPLATE): cv.template,
     vol.Optional(CONF_TURN_ON_ACTION): cv.SCRIPT_SCHEMA,
     vol.Optional(CONF_TURN_OFF_ACTION): cv.SCRIPT_SCHEMA,
     vol.Optional(CONF_SET_TEMPERATURE_ACTION): cv.SCRIPT_SCHEMA,
@@ -168,24 +196,22 @@ CLIMATE_SCHEMA = {
     vol.Optional(CONF_SET_FAN_MODE_ACTION): cv.SCRIPT_SCHEMA,
     vol.Optional(CONF_SET_SWING_MODE_ACTION): cv.SCRIPT_SCHEMA,
     vol.Optional(CONF_SET_SWING_HORIZONTAL_MODE_ACTION): cv.SCRIPT_SCHEMA,
-    vol.Optional(
-        CONF_MODE_LIST,
-        default=[HVACMode.AUTO, HVACMode.HEAT],
-    ): vol.All(cv.ensure_list, [vol.In(HVAC_MODES)]),
-    vol.Optional(
-        CONF_PRESET_MODES_LIST,
-        default=[],
-    ): vol.All(cv.ensure_list, [vol.Coerce(str)]),
-    vol.Optional(
-        CONF_FAN_MODES_LIST,
-        default=[FAN_OFF, FAN_ON],
-    ): vol.All(cv.ensure_list, [vol.Coerce(str)]),
-    vol.Optional(CONF_SWING_MODES_LIST, default=[SWING_ON, SWING_OFF]): vol.All(
+    vol.Optional(CONF_ACTION_NO_WAIT, default=False): cv.boolean,
+    vol.Optional(CONF_MODE_LIST, default=list(DEFAULT_MODES)): vol.All(
+        cv.ensure_list, [vol.In(HVAC_MODES)]
+    ),
+    vol.Optional(CONF_PRESET_MODES_LIST, default=list(DEFAULT_PRESET_MODES)): vol.All(
+        cv.ensure_list, [vol.Coerce(str)]
+    ),
+    vol.Optional(CONF_FAN_MODES_LIST, default=list(DEFAULT_FAN_MODES)): vol.All(
+        cv.ensure_list, [vol.Coerce(str)]
+    ),
+    vol.Optional(CONF_SWING_MODES_LIST, default=list(DEFAULT_SWING_MODES)): vol.All(
         cv.ensure_list, [vol.Coerce(str)]
     ),
     vol.Optional(
         CONF_SWING_HORIZONTAL_MODE_LIST,
-        default=[SWING_HORIZONTAL_ON, SWING_HORIZONTAL_OFF],
+        default=list(DEFAULT_SWING_HORIZONTAL_MODES),
     ): vol.All(cv.ensure_list, [vol.Coerce(str)]),
 }
 
@@ -204,6 +230,15 @@ PLATFORM_SCHEMA = (
 DEFAULT_INITIAL_TEMPERATURE = 21.0
 DEFAULT_INITIAL_HUMIDITY = 50.0
 
+SET_TEMPERATURE_COOLDOWN = 0.1
+
+# Setpoints closer together than this are considered the same value
+SETPOINT_TOLERANCE = 1e-3
+
+
+def _setpoint_changed(new: float, old: float | None) -> bool:
+    return old is None or abs(new - old) > SETPOINT_TOLERANCE
+
 
 async def async_setup_platform(
     hass: HomeAssistant,
@@ -230,6 +265,7 @@ class TemplateClimate(TemplateEntity, ClimateEntity, RestoreEntity):
     _entity_id_format = climate.ENTITY_ID_FORMAT
 
     _optimistic: bool
+    _action_no_wait: bool
 
     _current_temp_template: Template | None = None
     _target_temperature_template: Template | None = None
@@ -245,15 +281,155 @@ class TemplateClimate(TemplateEntity, ClimateEntity, RestoreEntity):
     _swing_mode_template: Template | None = None
     _swing_horizontal_mode_template: Template | None = None
 
-    _turn_on_script: Script | None = None
-    _turn_off_script: Script | None = None
-    _set_temperature_script: Script | None = None
-    _set_humidity_script: Script | None = None
-    _set_hvac_mode_script: Script | None = None
-    _set_preset_mode_script: Script | None = None
-    _set_fan_mode_script: Script | None = None
-    _set_swing_mode_script: Script | None = None
-    _set_swing_horizontal_mode_script: Script | None = None
+    _TEMPLATE_CONFIG_KEYS: tuple[tuple[str, str], ...] = (
+        (CONF_CURRENT_TEMP_TEMPLATE, "_current_temp_template"),
+        (CONF_TARGET_TEMPERATURE_TEMPLATE, "_target_temperature_template"),
+        (CONF_TARGET_TEMPERATURE_LOW_TEMPLATE, "_target_temperature_low_template"),
+        (CONF_TARGET_TEMPERATURE_HIGH_TEMPLATE, "_target_temperature_high_template"),
+        (CONF_CURRENT_HUMIDITY_TEMPLATE, "_current_humidity_template"),
+        (CONF_TARGET_HUMIDITY_TEMPLATE, "_target_humidity_template"),
+        (CONF_HVAC_MODE_TEMPLATE, "_hvac_mode_template"),
+        (CONF_HVAC_ACTION_TEMPLATE, "_hvac_action_template"),
+        (CONF_HVAC_FEATURES_TEMPLATE, "_hvac_features_template"),
+        (CONF_PRESET_MODE_TEMPLATE, "_preset_mode_template"),
+        (CONF_FAN_MODE_TEMPLATE, "_fan_mode_template"),
+        (CONF_SWING_MODE_TEMPLATE, "_swing_mode_template"),
+        (CONF_SWING_HORIZONTAL_MODE_TEMPLATE, "_swing_horizontal_mode_template"),
+    )
+
+    # (template attribute, attribute) that service calls can set optimistically
+    _OPTIMISTIC_ATTRIBUTES: tuple[tuple[str, str], ...] = (
+        ("_target_temperature_template", "_attr_target_temperature"),
+        ("_target_temperature_low_template", "_attr_target_temperature_low"),
+        ("_target_temperature_high_template", "_attr_target_temperature_high"),
+        ("_target_humidity_template", "_attr_target_humidity"),
+        ("_hvac_mode_template", "_attr_hvac_mode"),
+        ("_preset_mode_template", "_attr_preset_mode"),
+        ("_fan_mode_template", "_attr_fan_mode"),
+        ("_swing_mode_template", "_attr_swing_mode"),
+        ("_swing_horizontal_mode_template", "_attr_swing_horizontal_mode"),
+    )
+
+    # attribute: (action, run variable, changed check) for the single value setters
+    _SETTER_ACTIONS: ClassVar[
+        dict[str, tuple[str, str, Callable[[Any, Any], bool]]]
+    ] = {
+        "_attr_target_humidity": (
+            CONF_SET_HUMIDITY_ACTION,
+            ATTR_HUMIDITY,
+            _setpoint_changed,
+        ),
+        "_attr_hvac_mode": (CONF_SET_HVAC_MODE_ACTION, ATTR_HVAC_MODE, operator.ne),
+        "_attr_preset_mode": (
+            CONF_SET_PRESET_MODE_ACTION,
+            ATTR_PRESET_MODE,
+            operator.ne,
+        ),
+        "_attr_fan_mode": (CONF_SET_FAN_MODE_ACTION, ATTR_FAN_MODE, operator.ne),
+        "_attr_swing_mode": (CONF_SET_SWING_MODE_ACTION, ATTR_SWING_MODE, operator.ne),
+        "_attr_swing_horizontal_mode": (
+            CONF_SET_SWING_HORIZONTAL_MODE_ACTION,
+            ATTR_SWING_HORIZONTAL_MODE,
+            operator.ne,
+        ),
+    }
+
+    # (feature, supported when optimistic, template attributes, action)
+    _DEFAULT_FEATURE_SOURCES: tuple[
+        tuple[ClimateEntityFeature, bool, tuple[str, ...], str], ...
+    ] = (
+        (
+            ClimateEntityFeature.TARGET_TEMPERATURE,
+            True,
+            ("_target_temperature_template",),
+            CONF_SET_TEMPERATURE_ACTION,
+        ),
+        (
+            ClimateEntityFeature.TARGET_TEMPERATURE_RANGE,
+            True,
+            ("_target_temperature_low_template", "_target_temperature_high_template"),
+            CONF_SET_TEMPERATURE_ACTION,
+        ),
+        (
+            ClimateEntityFeature.TARGET_HUMIDITY,
+            False,
+            ("_target_humidity_template",),
+            CONF_SET_HUMIDITY_ACTION,
+        ),
+        (
+            ClimateEntityFeature.PRESET_MODE,
+            False,
+            ("_preset_mode_template",),
+            CONF_SET_PRESET_MODE_ACTION,
+        ),
+        (
+            ClimateEntityFeature.FAN_MODE,
+            False,
+            ("_fan_mode_template",),
+            CONF_SET_FAN_MODE_ACTION,
+        ),
+        (
+            ClimateEntityFeature.SWING_MODE,
+            False,
+            ("_swing_mode_template",),
+            CONF_SET_SWING_MODE_ACTION,
+        ),
+        (
+            ClimateEntityFeature.SWING_HORIZONTAL_MODE,
+            False,
+            ("_swing_horizontal_mode_template",),
+            CONF_SET_SWING_HORIZONTAL_MODE_ACTION,
+        ),
+    )
+
+    _actions: dict[str, Sequence[dict[str, Any]]]
+    _scripts: dict[str, Script]
+    _set_temperature_variables: dict[str, Any] | None
+    _set_temperature_debouncer: Debouncer[Coroutine[Any, Any, None]]
+
+    _last_features_value: Any = _NOT_RENDERED
+
+    # (attribute, template attribute, valid values), floats have no valid values
+    _TEMPLATE_ATTRIBUTES: tuple[tuple[str, str, str | dict[str, str] | None], ...] = (
+        ("_attr_current_temperature", "_current_temp_template", None),
+        ("_attr_target_temperature", "_target_temperature_template", None),
+        ("_attr_target_temperature_low", "_target_temperature_low_template", None),
+        ("_attr_target_temperature_high", "_target_temperature_high_template", None),
+        ("_attr_current_humidity", "_current_humidity_template", None),
+        ("_attr_target_humidity", "_target_humidity_template", None),
+        ("_attr_hvac_mode", "_hvac_mode_template", "_hvac_mode_lookup"),
+        ("_attr_hvac_action", "_hvac_action_template", _HVAC_ACTION_LOOKUP),
+        ("_attr_preset_mode", "_preset_mode_template", "_preset_mode_lookup"),
+        ("_attr_fan_mode", "_fan_mode_template", "_fan_mode_lookup"),
+        ("_attr_swing_mode", "_swing_mode_template", "_swing_mode_lookup"),
+        (
+            "_attr_swing_horizontal_mode",
+            "_swing_horizontal_mode_template",
+            "_swing_horizontal_mode_lookup",
+        ),
+    )
+
+    # (state attribute, attribute) restored as is from the last state
+    _RESTORE_FLOAT_ATTRIBUTES: tuple[tuple[str, str], ...] = (
+        (ATTR_CURRENT_TEMPERATURE, "_attr_current_temperature"),
+        (ATTR_TEMPERATURE, "_attr_target_temperature"),
+        (ATTR_TARGET_TEMP_LOW, "_attr_target_temperature_low"),
+        (ATTR_TARGET_TEMP_HIGH, "_attr_target_temperature_high"),
+        (ATTR_CURRENT_HUMIDITY, "_attr_current_humidity"),
+        (ATTR_HUMIDITY, "_attr_target_humidity"),
+    )
+
+    # (state attribute, attribute, lookup name) restored when still valid
+    _RESTORE_ENUM_ATTRIBUTES: tuple[tuple[str, str, str], ...] = (
+        (ATTR_PRESET_MODE, "_attr_preset_mode", "_preset_mode_lookup"),
+        (ATTR_FAN_MODE, "_attr_fan_mode", "_fan_mode_lookup"),
+        (ATTR_SWING_MODE, "_attr_swing_mode", "_swing_mode_lookup"),
+        (
+            ATTR_SWING_HORIZONTAL_MODE,
+            "_attr_swing_horizontal_mode",
+            "_swing_horizontal_mode_lookup",
+        ),
+    )
 
     def __init__(
         self, hass: HomeAssistant, config: ConfigType, unique_id: str | None
@@ -263,12 +439,13 @@ class TemplateClimate(TemplateEntity, ClimateEntity, RestoreEntity):
 
         self._init_values(config)
         self._init_templates(config)
-        self._init_scripts(hass, config)
+        self._init_scripts(config)
         self._init_features()
         self._init_optimistic_state(config)
 
     def _init_values(self, config: ConfigType) -> None:
         self._optimistic = config.get(CONF_OPTIMISTIC, False)
+        self._action_no_wait = config[CONF_ACTION_NO_WAIT]
 
         if precision := config.get(CONF_PRECISION):
             self._attr_precision = precision
@@ -291,163 +468,161 @@ class TemplateClimate(TemplateEntity, ClimateEntity, RestoreEntity):
         self._attr_swing_modes = config[CONF_SWING_MODES_LIST]
         self._attr_swing_horizontal_modes = config[CONF_SWING_HORIZONTAL_MODE_LIST]
 
+        # Map valid template values to the value stored on the entity
+        self._hvac_mode_lookup: dict[str, str] = {
+            mode: HVACMode(mode) for mode in self._attr_hvac_modes
+        }
+        self._preset_mode_lookup = {mode: mode for mode in self._attr_preset_modes}
+        self._fan_mode_lookup = {mode: mode for mode in self._attr_fan_modes}
+        self._swing_mode_lookup = {mode: mode for mode in self._attr_swing_modes}
+        self._swing_horizontal_mode_lookup = {
+            mode: mode for mode in self._attr_swing_horizontal_modes
+        }
+
     def _init_templates(self, config: ConfigType) -> None:
-        self._current_temp_template = config.get(CONF_CURRENT_TEMP_TEMPLATE)
-        self._target_temperature_template = config.get(CONF_TARGET_TEMPERATURE_TEMPLATE)
-        self._target_temperature_low_template = config.get(
-            CONF_TARGET_TEMPERATURE_LOW_TEMPLATE
-        )
-        self._target_temperature_high_template = config.get(
-            CONF_TARGET_TEMPERATURE_HIGH_TEMPLATE
+        # Only configured templates are stored, others fall back to the class None
+        for config_key, template_attribute in self._TEMPLATE_CONFIG_KEYS:
+            if (template := config.get(config_key)) is not None:
+                setattr(self, template_attribute, template)
+
+        self._optimistic_attributes = frozenset(
+            attribute
+            for template_attribute, attribute in self._OPTIMISTIC_ATTRIBUTES
+            if self._optimistic or getattr(self, template_attribute) is None
         )
 
-        self._current_humidity_template = config.get(CONF_CURRENT_HUMIDITY_TEMPLATE)
-        self._target_humidity_template = config.get(CONF_TARGET_HUMIDITY_TEMPLATE)
+    def _init_scripts(self, config: ConfigType) -> None:
+        self._actions = {key: config[key] for key in ACTION_KEYS if key in config}
+        self._scripts = {}
 
-        self._hvac_mode_template = config.get(CONF_HVAC_MODE_TEMPLATE)
-        self._hvac_action_template = config.get(CONF_HVAC_ACTION_TEMPLATE)
-        self._hvac_features_template = config.get(CONF_HVAC_FEATURES_TEMPLATE)
-        self._preset_mode_template = config.get(CONF_PRESET_MODE_TEMPLATE)
-        self._fan_mode_template = config.get(CONF_FAN_MODE_TEMPLATE)
-        self._swing_mode_template = config.get(CONF_SWING_MODE_TEMPLATE)
+        self._set_temperature_variables = None
 
-    def _init_script(
-        self,
-        hass: HomeAssistant,
-        config: ConfigType,
-        action_key: str,
-    ) -> Script | None:
-        sequence = config.get(action_key)
-        if sequence is None:
+    def _get_script(self, action_key: str) -> Script | None:
+        if (script := self._scripts.get(action_key)) is not None:
+            return script
+
+        if (sequence := self._actions.get(action_key)) is None:
             return None
 
         name = self._attr_name
         if TYPE_CHECKING:
             assert name is not None
 
-        return Script(hass, sequence, name, DOMAIN)
+        # Background runs can overlap, queue them so no call is dropped
+        script_mode = SCRIPT_MODE_QUEUED if self._action_no_wait else SCRIPT_MODE_SINGLE
+        script = Script(self.hass, sequence, name, DOMAIN, script_mode=script_mode)
+        self._scripts[action_key] = script
+        return script
 
-    def _init_scripts(self, hass: HomeAssistant, config: ConfigType) -> None:
-        self._turn_on_script = self._init_script(hass, config, CONF_TURN_ON_ACTION)
-        self._turn_off_script = self._init_script(hass, config, CONF_TURN_OFF_ACTION)
-        self._set_temperature_script = self._init_script(
-            hass, config, CONF_SET_TEMPERATURE_ACTION
-        )
-        self._set_humidity_script = self._init_script(
-            hass, config, CONF_SET_HUMIDITY_ACTION
-        )
-        self._set_hvac_mode_script = self._init_script(
-            hass, config, CONF_SET_HVAC_MODE_ACTION
-        )
-        self._set_preset_mode_script = self._init_script(
-            hass, config, CONF_SET_PRESET_MODE_ACTION
-        )
-        self._set_fan_mode_script = self._init_script(
-            hass, config, CONF_SET_FAN_MODE_ACTION
-        )
-        self._set_swing_mode_script = self._init_script(
-            hass, config, CONF_SET_SWING_MODE_ACTION
+    async def _async_run_action(
+        self,
+        action_key: str,
+        run_variables: dict[str, Any] | None = None,
+        *,
+        wait: bool = False,
+    ) -> bool:
+        script = self._get_script(action_key)
+        if script is None:
+            return False
+
+        run = self.async_run_script(
+            script, run_variables=run_variables, context=self._context
         )
+        if self._action_no_wait and not wait:
+            # Errors in the action are only logged, the caller no longer awaits it
+            self.hass.async_create_task(run, f"{self.entity_id} {action_key}")
+        else:
+            await run
+
+        return True
 
     def _init_features(self) -> None:
         if self._hvac_features_template is not None:
             return
 
-        support = ClimateEntityFeature.TURN_ON | ClimateEntityFeature.TURN_OFF
-
-        if (
-            self._optimistic
-            or self._target_temperature_template is not None
-            or self._set_temperature_script is not None
-        ):
-            support |= ClimateEntityFeature.TARGET_TEMPERATURE
-
-        if (
-            self._optimistic
-            or self._target_temperature_low_template is not None
-            or self._target_temperature_high_template is not None
-            or self._set_temperature_script is not None
-        ):
-            support |= ClimateEntityFeature.TARGET_TEMPERATURE_RANGE
-
-        if (
-            self._target_humidity_template is not None
-            or self._set_humidity_script is not None
-        ):
-            support |= ClimateEntityFeature.TARGET_HUMIDITY
-
-        if (
-            self._preset_mode_template is not None
-            or self._set_preset_mode_script is not None
-        ):
-            support |= ClimateEntityFeature.PRESET_MODE
-
-        if self._fan_mode_template is not None or self._set_fan_mode_script is not None:
-            support |= ClimateEntityFeature.FAN_MODE
-
-        if (
-            self._swing_mode_template is not None
-            or self._set_swing_mode_script is not None
-        ):
-            support |= ClimateEntityFeature.SWING_MODE
-
-        if (
-            self._swing_horizontal_mode_template is not None
-            or self._set_swing_horizontal_mode_script is not None
-        ):
-            support |= ClimateEntityFeature.SWING_HORIZONTAL_MODE
-
-        self._attr_supported_features = support
+        support = (
+            ClimateEntityFeature.TURN_ON.value | ClimateEntityFeature.TURN_OFF.value
+        )
+        for (
+            feature,
+            optimistic,
+            template_attributes,
+            action_key,
+        ) in self._DEFAULT_FEATURE_SOURCES:
+            if (
+                (optimistic and self._optimistic)
+                or action_key in self._actions
+                or any(getattr(self, attr) is not None for attr in template_attributes)
+            ):
+                support |= feature.value
+
+        self._attr_supported_features = ClimateEntityFeature(support)
 
     def _init_optimistic_state(self, config: ConfigType) -> None:
-        init_temp: float = config.get(
-            CONF_TEMP_INITIAL,
-            TemperatureConverter.convert(
+        init_temp: float | None = config.get(CONF_TEMP_INITIAL)
+        if init_temp is None:
+            init_temp = TemperatureConverter.convert(
                 DEFAULT_INITIAL_TEMPERATURE,
                 UnitOfTemperature.CELSIUS,
                 self.temperature_unit,
-            ),
-        )
-        if self._target_temperature_template is None or self._optimistic:
+            )
+        optimistic_attributes = self._optimistic_attributes
+        if "_attr_target_temperature" in optimistic_attributes:
             self._attr_target_temperature = init_temp
-        if self._target_temperature_low_template is None or self._optimistic:
+        if "_attr_target_temperature_low" in optimistic_attributes:
             self._attr_target_temperature_low = init_temp
-        if self._target_temperature_high_template is None or self._optimistic:
+        if "_attr_target_temperature_high" in optimistic_attributes:
             self._attr_target_temperature_high = init_temp
 
-        if self._target_humidity_template is None or self._optimistic:
+        if "_attr_target_humidity" in optimistic_attributes:
             self._attr_target_humidity = config.get(
                 CONF_HUMIDITY_INITIAL, DEFAULT_INITIAL_HUMIDITY
             )
 
         if (
-            self._hvac_mode_template is None or self._optimistic
-        ) and HVACMode.OFF in self.hvac_modes:
+            "_attr_hvac_mode" in optimistic_attributes
+            and HVACMode.OFF in self._hvac_mode_lookup
+        ):
             self._attr_hvac_mode = HVACMode.OFF
 
-        if (self._fan_mode_template is None or self._optimistic) and FAN_OFF in (
-            self.fan_modes or []
+        if (
+            "_attr_fan_mode" in optimistic_attributes
+            and FAN_OFF in self._fan_mode_lookup
         ):
             self._attr_fan_mode = FAN_OFF
 
-        if (self._swing_mode_template is None or self._optimistic) and SWING_OFF in (
-            self.swing_modes or []
+        if (
+            "_attr_swing_mode" in optimistic_attributes
+            and SWING_OFF in self._swing_mode_lookup
         ):
             self._attr_swing_mode = SWING_OFF
 
         if (
-            self._swing_horizontal_mode_template is None or self._optimistic
-        ) and SWING_HORIZONTAL_OFF in (self.swing_horizontal_modes or []):
+            "_attr_swing_horizontal_mode" in optimistic_attributes
+            and SWING_HORIZONTAL_OFF in self._swing_horizontal_mode_lookup
+        ):
             self._attr_swing_horizontal_mode = SWING_HORIZONTAL_OFF
 
-    async def async_added_to_hass(self) -> None:  # noqa: PLR0912
+    async def async_added_to_hass(self) -> None:
         """Run when entity about to be added."""
-        await super().async_added_to_hass()
+        # Restore before the templates are set up, so results of static
+        # templates are not overwritten by the last state
+        if (last_state := await self.async_get_last_state()) is not None:
+            self._restore_state(last_state)
+
+        # Created on every add, removal shuts the debouncer down and the same
+        # entity can be added again, for example after an entity_id change
+        self._set_temperature_debouncer = Debouncer(
+            self.hass,
+            _LOGGER,
+            cooldown=SET_TEMPERATURE_COOLDOWN,
+            immediate=False,
+            function=self._async_run_set_temperature_action,
+        )
 
-        last_state = await self.async_get_last_state()
-        if last_state is None:
-            return
+        await super().async_added_to_hass()
 
+    def _restore_state(self, last_state: State) -> None:
         last_attributes = last_state.attributes
 
         if self._hvac_features_template is not None:
@@ -457,121 +632,60 @@ class TemplateClimate(TemplateEntity, ClimateEntity, RestoreEntity):
             except ValueError:
                 self._attr_supported_features = ClimateEntityFeature(0)
 
-        if last_state.state in self.hvac_modes:
-            self._attr_hvac_mode = HVACMode(last_state.state)
-
-        if (temp := last_attributes.get(ATTR_CURRENT_TEMPERATURE)) is not None:
-            self._attr_current_temperature = temp
-        if (temp := last_attributes.get(ATTR_TEMPERATURE)) is not None:
-            self._attr_target_temperature = temp
-        if (temp := last_attributes.get(ATTR_TARGET_TEMP_LOW)) is not None:
-            self._attr_target_temperature_low = temp
-        if (temp := last_attributes.get(ATTR_TARGET_TEMP_HIGH)) is not None:
-            self._attr_target_temperature_high = temp
-
-        if (humidity := last_attributes.get(ATTR_CURRENT_HUMIDITY)) is not None:
-            self._attr_current_humidity = humidity
-        if (humidity := last_attributes.get(ATTR_HUMIDITY)) is not None:
-            self._attr_target_humidity = humidity
-
-        if last_attributes.get(ATTR_HVAC_ACTION) in CURRENT_HVAC_ACTIONS:
-            self._attr_hvac_action = HVACAction(last_attributes.get(ATTR_HVAC_ACTION))
+        if (hvac_mode := self._hvac_mode_lookup.get(last_state.state)) is not None:
+            self._attr_hvac_mode = hvac_mode
 
-        if last_attributes.get(ATTR_PRESET_MODE) in (self.preset_modes or []):
-            self._attr_preset_mode = last_attributes[ATTR_PRESET_MODE]
+        for state_attribute, attribute in self._RESTORE_FLOAT_ATTRIBUTES:
+            if (value := last_attributes.get(state_attribute)) is not None:
+                setattr(self, attribute, value)
 
-        if last_attributes.get(ATTR_FAN_MODE) in (self.fan_modes or []):
-            self._attr_fan_mode = last_attributes[ATTR_FAN_MODE]
+        hvac_action = _HVAC_ACTION_LOOKUP.get(last_attributes.get(ATTR_HVAC_ACTION))
+        if hvac_action is not None:
+            self._attr_hvac_action = hvac_action
 
-        if last_attributes.get(ATTR_SWING_MODE) in (self.swing_modes or []):
-            self._attr_swing_mode = last_attributes[ATTR_SWING_MODE]
+        for state_attribute, attribute, lookup_name in self._RESTORE_ENUM_ATTRIBUTES:
+            lookup: dict[str, str] = getattr(self, lookup_name)
+            if (value := lookup.get(last_attributes.get(state_attribute))) is not None:
+                setattr(self, attribute, value)
 
-        if last_attributes.get(ATTR_SWING_HORIZONTAL_MODE) in (
-            self.swing_horizontal_modes or []
-        ):
-            self._attr_swing_horizontal_mode = last_attributes[
-                ATTR_SWING_HORIZONTAL_MODE
-            ]
+    async def async_will_remove_from_hass(self) -> None:
+        """Run when entity will be removed."""
+        self._set_temperature_debouncer.async_shutdown()
+        await super().async_will_remove_from_hass()
 
     def _setup_template_attribute(
         self,
         attribute: str,
-        template: Template | None,
-        on_update: Callable[[str, Any], None],
+        template: Template,
+        on_update: Callable[[Any], None],
     ) -> None:
-        if not template:
+        if template.is_static:
+            # Static templates never change, apply the result without a listener.
+            # Like tracked renders, pass the raw string, "1.50" stays a valid mode.
+            on_update(template.async_render(parse_result=False))
             return
 
-        self.add_template_attribute(
-            attribute,
-            template,
-            None,
-            partial(on_update, attribute),
-        )
+        self.add_template_attribute(attribute, template, None, on_update)
 
     @callback
     def _async_setup_templates(self) -> None:
-        self._setup_template_attribute(
-            "_attr_current_temperature", self._current_temp_template, self._update_float
-        )
-        self._setup_template_attribute(
-            "_attr_target_temperature",
-            self._target_temperature_template,
-            self._update_float,
-        )
-        self._setup_template_attribute(
-            "_attr_target_temperature_low",
-            self._target_temperature_low_template,
-            self._update_float,
-        )
-        self._setup_template_attribute(
-            "_attr_target_temperature_high",
-            self._target_temperature_high_template,
-            self._update_float,
-        )
-        self._setup_template_attribute(
-            "_attr_current_humidity",
-            self._current_humidity_template,
-            self._update_float,
-        )
-        self._setup_template_attribute(
-            "_attr_target_humidity", self._target_humidity_template, self._update_float
-        )
-        self._setup_template_attribute(
-            "_attr_hvac_mode",
-            self._hvac_mode_template,
-            partial(self._update_enum, "_attr_hvac_modes"),
-        )
-        self._setup_template_attribute(
-            "_attr_hvac_action",
-            self._hvac_action_template,
-            partial(self._update_enum, CURRENT_HVAC_ACTIONS),
-        )
-        self._setup_template_attribute(
-            "_attr_preset_mode",
-            self._preset_mode_template,
-            partial(self._update_enum, "_attr_preset_modes"),
-        )
-        self._setup_template_attribute(
-            "_attr_fan_mode",
-            self._fan_mode_template,
-            partial(self._update_enum, "_attr_fan_modes"),
-        )
-        self._setup_template_attribute(
-            "_attr_swing_mode",
-            self._swing_mode_template,
-            partial(self._update_enum, "_attr_swing_modes"),
-        )
-        self._setup_template_attribute(
-            "_attr_swing_horizontal_mode",
-            self._swing_horizontal_mode_template,
-            partial(self._update_enum, "_attr_swing_horizontal_modes"),
-        )
+        for attribute, template_attribute, valid_values in self._TEMPLATE_ATTRIBUTES:
+            template = getattr(self, template_attribute)
+            if template is None:
+                continue
+
+            self._setup_template_attribute(
+                attribute,
+                template,
+                partial(self._update_float, attribute)
+                if valid_values is None
+                else self._enum_updater(attribute, valid_values),
+            )
+
         if self._hvac_features_template is not None:
-            self.add_template_attribute(
+            self._setup_template_attribute(
                 "_attr_hvac_features",
                 self._hvac_features_template,
-                None,
                 self._update_features,
             )
 
@@ -580,11 +694,9 @@ class TemplateClimate(TemplateEntity, ClimateEntity, RestoreEntity):
     @callback
     def _update_float(self, attribute: str, value: Any) -> None:
         try:
-            if value is None or value in (STATE_UNAVAILABLE, STATE_UNKNOWN):
-                setattr(self, attribute, None)
-            else:
-                setattr(self, attribute, float(value))
-
+            new_value = (
+                None if value is None or value in _INVALID_STATES else float(value)
+            )
         except (ValueError, TypeError):
             _LOGGER.exception(
                 "Received invalid %s: %s for entity %s",
@@ -592,29 +704,34 @@ class TemplateClimate(TemplateEntity, ClimateEntity, RestoreEntity):
                 value,
                 self.entity_id,
             )
+            return
 
-    @callback
-    def _update_enum(
-        self, valid_values: str | list[str], attribute: str, value: Any
-    ) -> None:
-        valid_values = (
-            valid_values
-            if isinstance(valid_values, list)
-            else getattr(self, valid_values)
+        setattr(self, attribute, new_value)
+
+    def _enum_updater(
+        self, attribute: str, valid_values: str | dict[str, str]
+    ) -> Callable[[Any], None]:
+        lookup: dict[str, str] = (
+            getattr(self, valid_values)
+            if isinstance(valid_values, str)
+            else valid_values
         )
 
-        if value in valid_values:
-            setattr(self, attribute, value)
-        elif value in (STATE_UNAVAILABLE, STATE_UNKNOWN):
-            setattr(self, attribute, None)
-        else:
-            _LOGGER.error(
-                "Received invalid %s: %s for entity %s",
-                attribute,
-                value,
-                self.entity_id,
-            )
-            setattr(self, attribute, None)
+        @callback
+        def _update_enum(value: Any) -> None:
+            key = value if type(value) is str else str(value)
+            member = lookup.get(key)
+            if member is None and key not in _INVALID_STATES:
+                _LOGGER.error(
+                    "Received invalid %s: %s for entity %s",
+                    attribute,
+                    value,
+                    self.entity_id,
+                )
+
+            setattr(self, attribute, member)
+
+        return _update_enum
 
     def _parse_features_value(self, value: Any) -> list[str]:
         if not value:
@@ -624,8 +741,12 @@ class TemplateClimate(TemplateEntity, ClimateEntity, RestoreEntity):
 
         string_value = str(value)
         try:
-            value_json = json.loads(string_value)
-            features = value_json if isinstance(value_json, list) else [string_value]
+            value_json = json_loads(string_value)
+            features = (
+                [str(feature) for feature in value_json]
+                if isinstance(value_json, list)
+                else [string_value]
+            )
         except ValueError:
             features = [string_value]
 
@@ -641,63 +762,43 @@ class TemplateClimate(TemplateEntity, ClimateEntity, RestoreEntity):
 
     @callback
     def _update_features(self, value: Any) -> None:
+        if value == self._last_features_value:
+            return
+        self._last_features_value = value
+
         features = self._parse_features_value(value)
 
-        support: ClimateEntityFeature = ClimateEntityFeature(0)
-        if HVACFeature.TURN_ON.value in features:
-            support |= ClimateEntityFeature.TURN_ON
-        if HVACFeature.TURN_OFF.value in features:
-            support |= ClimateEntityFeature.TURN_OFF
-        if HVACFeature.TARGET_TEMPERATURE.value in features:
-            support |= ClimateEntityFeature.TARGET_TEMPERATURE
-        if HVACFeature.TARGET_TEMPERATURE_RANGE.value in features:
-            support |= ClimateEntityFeature.TARGET_TEMPERATURE_RANGE
-        if HVACFeature.TARGET_HUMIDITY.value in features:
-            support |= ClimateEntityFeature.TARGET_HUMIDITY
-        if HVACFeature.PRESET_MODE.value in features:
-            support |= ClimateEntityFeature.PRESET_MODE
-        if HVACFeature.FAN_MODE.value in features:
-            support |= ClimateEntityFeature.FAN_MODE
-        if HVACFeature.SWING_MODE.value in features:
-            support |= ClimateEntityFeature.SWING_MODE
-        if HVACFeature.SWING_HORIZONTAL_MODE.value in features:
-            support |= ClimateEntityFeature.SWING_HORIZONTAL_MODE
-        self._attr_supported_features = support
+        support = 0
+        for feature in HVAC_FEATURE_FLAGS.keys() & features:
+            support |= HVAC_FEATURE_FLAGS[feature]
+
+        if support != self._attr_supported_features:
+            self._attr_supported_features = ClimateEntityFeature(support)
 
     async def async_turn_on(self) -> None:
         """Turn on the climate."""
-        if self._turn_on_script:
-            await self.async_run_script(
-                self._turn_on_script,
-                context=self._context,
-            )
-        else:
+        if not await self._async_run_action(CONF_TURN_ON_ACTION):
             await super().async_turn_on()
 
     async def async_turn_off(self) -> None:
         """Turn off the climate."""
-        if self._turn_off_script:
-            await self.async_run_script(
-                self._turn_off_script,
-                context=self._context,
-            )
-        else:
+        if not await self._async_run_action(CONF_TURN_OFF_ACTION):
             await super().async_turn_off()
 
-    def _set_temperature_attribute(
+    def _apply_optimistic(
         self,
-        temp: float | None,
-        template_attribute: str,
+        value: Any,
         attribute: str,
+        changed: Callable[[Any, Any], bool] = operator.ne,
     ) -> bool:
-        if temp is None:
+        if attribute not in self._optimistic_attributes:
             return False
 
-        if self._optimistic or getattr(self, template_attribute) is None:
-            setattr(self, attribute, temp)
-            return True
+        if not changed(value, getattr(self, attribute, None)):
+            return False
 
-        return False
+        setattr(self, attribute, value)
+        return True
 
     def _validate_set_temperature_arguments(
         self,
@@ -706,28 +807,35 @@ class TemplateClimate(TemplateEntity, ClimateEntity, RestoreEntity):
         temperature_low: float | None,
         temperature_high: float | None,
     ) -> None:
-        is_heat_cool = hvac_mode == HVACMode.HEAT_COOL or (
-            hvac_mode is None and self.hvac_mode == HVACMode.HEAT_COOL
-        )
-
-        if is_heat_cool and temperature_low is None:
-            message = f"Missing {ATTR_TARGET_TEMP_LOW} value in heat_cool mode"
-            raise ValueError(message)
-        if is_heat_cool and temperature_high is None:
-            message = f"Missing {ATTR_TARGET_TEMP_HIGH} value in heat_cool mode"
-            raise ValueError(message)
-        if is_heat_cool and temperature is not None:
-            message = f"{ATTR_TEMPERATURE} cannot be set in heat_cool mode"
-            raise ValueError(message)
-        if not is_heat_cool and (
-            temperature_low is not None or temperature_high is not None
-        ):
+        if hvac_mode is None:
+            hvac_mode = self.hvac_mode
+
+        if hvac_mode == HVACMode.HEAT_COOL:
+            if temperature_low is None:
+                message = f"Missing {ATTR_TARGET_TEMP_LOW} value in heat_cool mode"
+                raise ValueError(message)
+            if temperature_high is None:
+                message = f"Missing {ATTR_TARGET_TEMP_HIGH} value in heat_cool mode"
+                raise ValueError(message)
+            if temperature is not None:
+                message = f"{ATTR_TEMPERATURE} cannot be set in heat_cool mode"
+                raise ValueError(message)
+        elif temperature_low is not None or temperature_high is not None:
             message = (
                 f"{ATTR_TARGET_TEMP_LOW} and {ATTR_TARGET_TEMP_HIGH} "
                 "can only be set in heat_cool mode"
             )
             raise ValueError(message)
 
+    async def _async_run_set_temperature_action(self) -> None:
+        # The debouncer drops calls made while the action runs, so wait for each
+        # run and keep going until no variables are pending
+        while (run_variables := self._set_temperature_variables) is not None:
+            self._set_temperature_variables = None
+            await self._async_run_action(
+                CONF_SET_TEMPERATURE_ACTION, run_variables, wait=True
+            )
+
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set new target temperature and optionally hvac mode."""
         hvac_mode: HVACMode | None = kwargs.get(ATTR_HVAC_MODE)
@@ -739,132 +847,83 @@ class TemplateClimate(TemplateEntity, ClimateEntity, RestoreEntity):
             hvac_mode, temperature, temperature_low, temperature_high
         )
 
-        if hvac_mode is not None and hvac_mode in self.hvac_modes:
-            await self.async_set_hvac_mode(hvac_mode)
-
-        if self._set_temperature_script:
-            await self.async_run_script(
-                self._set_temperature_script,
-                run_variables={
-                    ATTR_HVAC_MODE: hvac_mode,
-                    ATTR_TEMPERATURE: temperature,
-                    ATTR_TARGET_TEMP_LOW: temperature_low,
-                    ATTR_TARGET_TEMP_HIGH: temperature_high,
-                },
-                context=self._context,
-            )
+        set_hvac_mode = (
+            hvac_mode is not None
+            and hvac_mode != self.hvac_mode
+            and hvac_mode in self._hvac_mode_lookup
+        )
 
-        changed = False
+        changed = set_hvac_mode and self._apply_optimistic(hvac_mode, "_attr_hvac_mode")
+        for temp, attribute in (
+            (temperature, "_attr_target_temperature"),
+            (temperature_low, "_attr_target_temperature_low"),
+            (temperature_high, "_attr_target_temperature_high"),
+        ):
+            if temp is not None:
+                changed |= self._apply_optimistic(temp, attribute, _setpoint_changed)
 
-        if (
-            self._optimistic or self._target_temperature_template is None
-        ) and temperature is not None:
-            changed |= self._set_temperature_attribute(
-                temperature,
-                "_target_temperature_template",
-                "_attr_target_temperature",
-            )
+        if changed:
+            self.async_write_ha_state()
 
-        if (
-            self._optimistic or self._target_temperature_low_template is None
-        ) and temperature_low is not None:
-            changed |= self._set_temperature_attribute(
-                temperature_low,
-                "_target_temperature_low_template",
-                "_attr_target_temperature_low",
+        # Run the actions in order, devices often only accept a target
+        # temperature for the hvac mode they are currently in. The hvac mode
+        # action is awaited even with action_no_wait for that reason.
+        if set_hvac_mode:
+            await self._async_run_action(
+                CONF_SET_HVAC_MODE_ACTION, {ATTR_HVAC_MODE: hvac_mode}, wait=True
             )
 
-        if (
-            self._optimistic or self._target_temperature_high_template is None
-        ) and temperature_high is not None:
-            changed |= self._set_temperature_attribute(
-                temperature_high,
-                "_target_temperature_high_template",
-                "_attr_target_temperature_high",
-            )
+        if CONF_SET_TEMPERATURE_ACTION in self._actions and (
+            temperature is not None
+            or temperature_low is not None
+            or temperature_high is not None
+        ):
+            run_variables = {
+                ATTR_HVAC_MODE: hvac_mode,
+                ATTR_TEMPERATURE: temperature,
+                ATTR_TARGET_TEMP_LOW: temperature_low,
+                ATTR_TARGET_TEMP_HIGH: temperature_high,
+            }
+            if self._action_no_wait:
+                # Bursts of calls, like dragging a slider, only run the action
+                # once with the variables of the last call
+                self._set_temperature_variables = run_variables
+                await self._set_temperature_debouncer.async_call()
+            else:
+                await self._async_run_action(CONF_SET_TEMPERATURE_ACTION, run_variables)
 
-        if changed:
+    async def _async_set_value(self, attribute: str, value: Any) -> None:
+        action_key, run_variable, changed = self._SETTER_ACTIONS[attribute]
+        if self._apply_optimistic(value, attribute, changed):
             self.async_write_ha_state()
 
+        await self._async_run_action(action_key, {run_variable: value})
+
     async def async_set_humidity(self, humidity: float) -> None:
         """Set new target humidity."""
-        if self._set_humidity_script:
-            await self.async_run_script(
-                self._set_humidity_script,
-                run_variables={ATTR_HUMIDITY: humidity},
-                context=self._context,
-            )
-
-        if self._optimistic or self._target_humidity_template is None:
-            self._attr_target_humidity = humidity
-            self.async_write_ha_state()
+        await self._async_set_value("_attr_target_humidity", humidity)
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set new operation mode."""
-        if self._set_hvac_mode_script:
-            await self.async_run_script(
-                self._set_hvac_mode_script,
-                run_variables={ATTR_HVAC_MODE: hvac_mode},
-                context=self._context,
-            )
-
-        if (self._optimistic or self._hvac_mode_template is None) and (
-            hvac_mode != self.hvac_mode
-        ):
-            self._attr_hvac_mode = hvac_mode
-            self.async_write_ha_state()
+        await self._async_set_value("_attr_hvac_mode", hvac_mode)
 
     async def async_set_preset_mode(self, preset_mode: str) -> None:
         """Set new preset mode."""
-        if self._set_preset_mode_script:
-            await self.async_run_script(
-                self._set_preset_mode_script,
-                run_variables={ATTR_PRESET_MODE: preset_mode},
-                context=self._context,
-            )
-
-        if self._optimistic or self._preset_mode_template is None:
-            self._attr_preset_mode = preset_mode
-            self.async_write_ha_state()
+        await self._async_set_value("_attr_preset_mode", preset_mode)
 
     async def async_set_fan_mode(self, fan_mode: str) -> None:
         """Set new fan mode."""
-        if self._set_fan_mode_script:
-            await self.async_run_script(
-                self._set_fan_mode_script,
-                run_variables={ATTR_FAN_MODE: fan_mode},
-                context=self._context,
-            )
-
-        if self._optimistic or self._fan_mode_template is None:
-            self._attr_fan_mode = fan_mode
-            self.async_write_ha_state()
+        await self._async_set_value("_attr_fan_mode", fan_mode)
 
     async def async_set_swing_mode(self, swing_mode: str) -> None:
         """Set new swing mode."""
-        if self._set_swing_mode_script:
-            await self.async_run_script(
-                self._set_swing_mode_script,
-                run_variables={ATTR_SWING_MODE: swing_mode},
-                context=self._context,
-            )
-
-        if self._optimistic or self._swing_mode_template is None:
-            self._attr_swing_mode = swing_mode
-            self.async_write_ha_state()
+        await self._async_set_value("_attr_swing_mode", swing_mode)
 
     async def async_set_swing_horizontal_mode(self, swing_horizontal_mode: str) -> None:
         """Set new swing horizontal mode."""
-        if self._set_swing_horizontal_mode_script:
-            await self.async_run_script(
-                self._set_swing_horizontal_mode_script,
-                run_variables={ATTR_SWING_HORIZONTAL_MODE: swing_horizontal_mode},
-                context=self._context,
-            )
-
-        if self._optimistic or self._swing_horizontal_mode_template is None:
-            self._attr_swing_horizontal_mode = swing_horizontal_mode
-            self.async_write_ha_state()
+        await self._async_set_value(
+            "_attr_swing_horizontal_mode", swing_horizontal_mode
+        )
 
     @property
     def target_temperature(self) -> float | None: